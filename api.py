@@ -5,7 +5,11 @@ This module provides a FastAPI implementation for the Human Design calculation
 system, offering endpoints to calculate various Human Design features.
 """
 
+import asyncio
+
+import anyio
 from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi.responses import ORJSONResponse
 from typing import Optional, List
 from pytz import all_timezones
 import datetime
@@ -17,35 +21,45 @@ from .models import (
     VariablesResponse
 )
 
-from .calculations import calculate_human_design, get_channel_meanings
-from .utils import get_utc_offset_from_tz
+from .calculations import calculate_human_design
+from .utils import get_cached_utc_offset
+
+# all_timezones is a list; use a frozenset for O(1) membership checks
+ALL_TIMEZONES = frozenset(all_timezones)
+
+# Feature keys that may be requested via the /calculate features filter
+PUBLIC_FEATURES = frozenset(HumanDesignResponse.model_fields)
 
 app = FastAPI(
     title="Human Design API",
     description="API for calculating Human Design features",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+def project_features(results: dict, features: List[str]) -> dict:
+    """Project a calculation result onto the requested feature keys.
+
+    Iterates only the requested set (intersected with the available
+    keys) instead of scanning the whole result dict.
+    """
+    requested = set(features)
+    return {key: results[key] for key in requested.intersection(results)}
+
 def validate_birth_data(birth_data: BirthData):
-    """Validate birth data and convert to timestamp format."""
-    # Validate date and time
-    try:
-        date = datetime.datetime(
-            birth_data.year, birth_data.month, birth_data.day,
-            birth_data.hour, birth_data.minute, birth_data.second
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid date or time: {str(e)}")
-    
+    """Resolve the timezone and convert birth data to timestamp format.
+
+    Date and time validity is already enforced by the BirthData model,
+    so only the timezone needs handling here.
+    """
     # Handle timezone
     if birth_data.timezone_name:
-        if birth_data.timezone_name not in all_timezones:
+        if birth_data.timezone_name not in ALL_TIMEZONES:
             raise HTTPException(status_code=400, detail=f"Invalid timezone name: {birth_data.timezone_name}")
         try:
-            tz_offset = get_utc_offset_from_tz(
-                (birth_data.year, birth_data.month, birth_data.day,
-                 birth_data.hour, birth_data.minute, birth_data.second),
-                birth_data.timezone_name
+            tz_offset = get_cached_utc_offset(
+                birth_data.timezone_name,
+                birth_data.year, birth_data.month, birth_data.day, birth_data.hour
             )
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Error calculating timezone offset: {str(e)}")
@@ -59,28 +73,54 @@ def validate_birth_data(birth_data: BirthData):
             birth_data.hour, birth_data.minute, birth_data.second, tz_offset)
 
 @app.post("/calculate", response_model=HumanDesignResponse, tags=["Human Design"])
-async def calculate_human_design_chart(birth_data: BirthData):
-    """Calculate the complete Human Design chart based on birth data."""
+async def calculate_human_design_chart(
+    birth_data: BirthData,
+    features: Optional[List[str]] = Query(
+        None,
+        description="Optional list of feature keys to return instead of the full chart"
+    )
+):
+    """Calculate the complete Human Design chart based on birth data.
+
+    Clients needing several features can request them here in one call
+    via the features query parameter instead of POSTing the same body
+    to each per-feature endpoint.
+    """
     timestamp = validate_birth_data(birth_data)
-    
+
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
-        
-        # Get channel meanings for a better response
-        channel_meanings = get_channel_meanings(result["channels_data"])
-        result["active_channels"] = [cm["channel"] for cm in channel_meanings]
-        
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
+
+        if features:
+            # Project onto the requested public keys; returned directly,
+            # bypassing the full response model
+            return ORJSONResponse(project_features(result, PUBLIC_FEATURES.intersection(features)))
+
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
+@app.post("/calculate-batch", response_model=List[HumanDesignResponse], tags=["Human Design"])
+async def calculate_human_design_batch(birth_data_list: List[BirthData]):
+    """Calculate complete Human Design charts for several birth data in one request."""
+    timestamps = [validate_birth_data(birth_data) for birth_data in birth_data_list]
+
+    try:
+        results = await asyncio.gather(*[
+            anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
+            for timestamp, birth_data in zip(timestamps, birth_data_list)
+        ])
+        return list(results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
+
 @app.post("/energy-type", response_model=EnergyTypeResponse, tags=["Features"])
 async def get_energy_type_and_strategy(birth_data: BirthData):
     """Get the energy type and strategy based on birth data."""
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {
             "energy_type": result["energy_type"],
             "strategy": result["strategy"]
@@ -94,7 +134,7 @@ async def get_authority(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {
             "authority": result["authority"],
             "authority_name": result["authority_name"]
@@ -108,7 +148,7 @@ async def get_profile(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {"profile": result["profile"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
@@ -119,7 +159,7 @@ async def get_defined_centers(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {"defined_centers": result["defined_centers"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
@@ -130,7 +170,7 @@ async def get_undefined_centers(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {"undefined_centers": result["undefined_centers"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
@@ -141,7 +181,7 @@ async def get_split_definition(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {"split": result["split"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
@@ -152,7 +192,7 @@ async def get_incarnation_cross(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {
             "incarnation_cross": result["incarnation_cross"],
             "cross_type": result["cross_type"]
@@ -166,9 +206,8 @@ async def get_active_channels(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
-        channel_meanings = get_channel_meanings(result["channels_data"])
-        return {"active_channels": channel_meanings}
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
+        return {"active_channels": result["channel_meanings"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
@@ -178,7 +217,7 @@ async def get_active_gates(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {
             "active_gates": result["active_gates"],
             "personality_gates": result["personality_gates"],
@@ -193,7 +232,7 @@ async def get_variables(birth_data: BirthData):
     timestamp = validate_birth_data(birth_data)
     
     try:
-        result = calculate_human_design(timestamp, birth_data.timezone_name)
+        result = await anyio.to_thread.run_sync(calculate_human_design, timestamp, birth_data.timezone_name)
         return {"variables": result["variables"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
@@ -14,180 +14,253 @@ based on a person's birth data. It includes calculations for:
 - And other Human Design characteristics
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import swisseph as swe
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Set, Tuple, Any, Union
 
 from constants import (
-    ICHING_OFFSET, SWE_PLANET_DICT, ICHING_CIRCLE_LIST, CHAKRA_LIST,
-    GATES_CHAKRA_DICT, CHANNEL_MEANING_DICT, IC_CROSS_TYP,
+    ICHING_OFFSET, SWE_PLANET_DICT, ICHING_CIRCLE_ARR, CHAKRA_SET,
+    GATES_CHAKRA_DICT, CHANNEL_MEANING_BY_PAIR, IC_CROSS_TYP, cross_type,
     STRATEGY_BY_TYPE, AUTHORITY_DESCRIPTIONS
 )
 from utils import timestamp_to_juldate, calc_create_date, julian_to_datetime
 
-# Pre-calculate the full dictionaries once for efficiency
+# Set the ephemeris path once at import so swe.calc_ut does not search
+# for data files on every call. Without data files swisseph falls back
+# to the built-in Moshier ephemeris, which is accurate enough here.
+swe.set_ephe_path(os.environ.get("SWE_EPHE_PATH"))
+_CALC_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Shared pool for the birth/design planet passes; swe.calc_ut releases
+# the GIL in its C core, so the two passes can overlap
+_PLANET_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Pre-calculate the per-gate lookup tables once for efficiency
 def _calc_full_gates_chakra_dict(gates_chakra_dict):
     """
-    From GATES_CHAKRA_DICT add keys in reversed order ([1,2]==[2,1])
-    """
-    cols = [
-        "full_ch_chakra_list",  # Chakra & Ch_Chakra of all channels
-        "full_ch_list",         # All channels
-        "full_ch_gates_chakra_dict",  # Dict channels:chakra
-        "full_chakra_1_list",   # Col 1 of full_chakra_list
-        "full_chakra_2_list",   # Col 2 of full_chakra_list
-        "full_gate_1_list",     # Col 1 of full_ch_list
-        "full_gate_2_list",     # Col 2 of full_ch_list
-        "full_gate_chakra_dict"  # Dict gate:chakra
-    ]
-    
-    # Initialize dict
-    full_dict = {k: [] for k in cols}
-    
-    # Channels in normal and reversed order
-    full_dict["full_ch_chakra_list"] = list(gates_chakra_dict.values()) + [item[::-1] for item in gates_chakra_dict.values()]
-    
-    # Channel gates in normal and reversed order
-    full_dict["full_ch_list"] = list(gates_chakra_dict.keys()) + [item[::-1] for item in gates_chakra_dict.keys()]
-    
-    # Make dict from channels and channel chakras e.g. (1,2):("XX","YY")
-    full_dict["full_ch_gates_chakra_dict"] = dict(
-        zip(full_dict["full_ch_list"], full_dict["full_ch_chakra_list"])
-    )
-    
-    # Select each first chakra
-    full_dict["full_chakra_1_list"] = [item[0] for item in full_dict["full_ch_chakra_list"]]
-    
-    # Select each second chakra
-    full_dict["full_chakra_2_list"] = [item[1] for item in full_dict["full_ch_chakra_list"]]
-    
-    # Select each first gate
-    full_dict["full_gate_1_list"] = [item[0] for item in full_dict["full_ch_list"]]
-    
-    # Select each second gate (channel gate)
-    full_dict["full_gate_2_list"] = [item[1] for item in full_dict["full_ch_list"]]
-    
-    # Make dict from first gate and first chakra list
-    full_dict["full_gate_chakra_dict"] = dict(
-        zip(full_dict["full_gate_1_list"], full_dict["full_chakra_1_list"])
-    )
-    
-    return full_dict
+    Build per-gate lookup tables from GATES_CHAKRA_DICT.
+
+    Channel symmetry ([1,2]==[2,1]) is handled by inserting each channel
+    under both of its gates, instead of storing reversed copies of the
+    whole channel lists.
+    """
+    gate_chakra = {}   # gate -> chakra
+    gate_partners = {}  # gate -> [(partner_gate, chakra, partner_chakra), ...]
+
+    for (gate_1, gate_2), (chakra_1, chakra_2) in gates_chakra_dict.items():
+        gate_chakra[gate_1] = chakra_1
+        gate_chakra[gate_2] = chakra_2
+        gate_partners.setdefault(gate_1, []).append((gate_2, chakra_1, chakra_2))
 
-# Create the full dictionary globally
+    # Reversed direction in a second pass, so partner precedence stays
+    # identical to the historical forward-then-reversed list order
+    for (gate_1, gate_2), (chakra_1, chakra_2) in gates_chakra_dict.items():
+        gate_partners.setdefault(gate_2, []).append((gate_1, chakra_2, chakra_1))
+
+    # Freeze partner lists as tuples; they are read-only lookup data
+    return {
+        "full_gate_chakra_dict": gate_chakra,
+        "gate_partners_dict": {
+            gate: tuple(partners) for gate, partners in gate_partners.items()
+        },
+    }
+
+# Create the full dictionary globally, with direct aliases for the
+# per-call lookups so hot code skips the extra dict hop
 FULL_DICT = _calc_full_gates_chakra_dict(GATES_CHAKRA_DICT)
+GATE_TO_CHAKRA = FULL_DICT["full_gate_chakra_dict"]
+GATE_PARTNERS = FULL_DICT["gate_partners_dict"]
+
+# Vectorization constants for date_to_gate, frozen at import
+PLANET_NAMES = tuple(SWE_PLANET_DICT.keys())
+PLANET_CODES = tuple(SWE_PLANET_DICT.values())
+N_PLANETS = len(PLANET_NAMES)
+# Earth and South Node sit opposite Sun and North Node respectively (+180°)
+PLANET_OFFSET = np.array(
+    [180.0 if name in ("Earth", "South_Node") else 0.0 for name in PLANET_NAMES]
+)
+# Gate lookup happens as one C-level gather over this table per call
+ICHING_ARR = ICHING_CIRCLE_ARR
+_CHAKRA_SET = CHAKRA_SET
+
+# Motor centers that can carry energy to the throat; the Sacral counts
+# as a motor for the Manifesting Generator check
+MOTORS = frozenset(("HT", "SP", "RT"))
+MOTORS_WITH_SACRAL = MOTORS | {"SL"}
+
+def _lons_to_gate_data(lon, iching_arr):
+    """
+    Quantize ecliptic longitudes into gate/line/color/tone/base arrays.
+
+    Kept as a standalone kernel so it can be JIT-compiled when numba
+    is available (see below).
+
+    Args:
+        lon (np.ndarray): Longitudes with Earth/South Node already flipped
+        iching_arr (np.ndarray): Gate order of the I-Ching circle
+
+    Returns:
+        tuple: (gate, line, color, tone, base) arrays
+    """
+    scaled = (((lon + ICHING_OFFSET) % 360) / 360) * 64
+    gate = iching_arr[scaled.astype(np.int64)]
+    line = (scaled * 6).astype(np.int64) % 6 + 1
+    color = (scaled * 36).astype(np.int64) % 6 + 1
+    tone = (scaled * 216).astype(np.int64) % 6 + 1
+    base = (scaled * 1080).astype(np.int64) % 5 + 1
+    return gate, line, color, tone, base
+
+# Optionally JIT-compile the quantization kernel. numba is not a hard
+# dependency; without it the vectorized NumPy path above is used as-is.
+try:
+    from numba import njit
+    _lons_to_gate_data = njit(cache=True, fastmath=True)(_lons_to_gate_data)
+    _lons_to_gate_data(np.zeros(1), ICHING_ARR)  # warm up at import
+except ImportError:
+    pass
+
+@lru_cache(maxsize=4096)
+def _planet_longitudes(jdut):
+    """
+    Get the ecliptic longitudes of all planets for a Julian day.
+
+    Cached because repeated API calls for the same birth time are common
+    and the ephemeris lookups dominate the calculation cost.
+
+    Args:
+        jdut (float): Timestamp in Julian day format
 
+    Returns:
+        np.ndarray: Longitude per planet, in SWE_PLANET_DICT order.
+            Treated as read-only by callers since the array is cached.
+    """
+    return np.array([swe.calc_ut(jdut, code, _CALC_FLAGS)[0][0] for code in PLANET_CODES])
+
+@lru_cache(maxsize=4096)
 def date_to_gate(jdut, label):
     """
     Calculate the Human Design gates, lines, colors, tones, and bases
     from planetary positions (longitude).
-    
+
+    Results are cached per (jdut, label); callers must treat the
+    returned dict as read-only and copy any list they modify.
+
     Args:
         jdut (float): Timestamp in Julian day format
         label (str): Indexing for "prs" (personality) or "des" (design) values
-    
+
     Returns:
         dict: Dict containing calculated values
     """
-    # Synchronize zodiac and I-Ching circle (58°)
-    offset = ICHING_OFFSET
-    
+    # Collect raw longitudes (swe.calc_ut itself cannot be batched)
+    # and flip Earth/South Node opposite Sun/North Node, branchless
+    lon = (_planet_longitudes(jdut) + PLANET_OFFSET) % 360
+
+    # Synchronize with the I-Ching circle (58°) and quantize to
+    # gate, line, color, tone, base in one pass
+    gate, line, color, tone, base = _lons_to_gate_data(lon, ICHING_ARR)
+
     result_dict = {
-        k: [] for k in ["label", "planets", "lon", "gate", "line", 
-                        "color", "tone", "base", "ch_gate"]
+        "label": [label] * N_PLANETS,
+        "planets": list(PLANET_NAMES),
+        "lon": lon.tolist(),
+        "gate": gate.tolist(),
+        "line": line.tolist(),
+        "color": color.tolist(),
+        "tone": tone.tolist(),
+        "base": base.tolist(),
+        "ch_gate": [0] * N_PLANETS,  # Will be filled later
     }
-    
-    for planet, planet_code in SWE_PLANET_DICT.items():
-        xx = swe.calc_ut(jdut, planet_code)
-        long = xx[0][0]
-        
-        # Earth is in opposite position from Sun
-        if planet == "Earth":
-            long = (long + 180) % 360
-        
-        # South Node is in opposite position from North Node
-        elif planet == "South_Node":
-            long = (long + 180) % 360
-            
-        angle = (long + offset) % 360
-        angle_percentage = angle / 360
-        
-        # Convert angle to gate, line, color, tone, base
-        gate = ICHING_CIRCLE_LIST[int(angle_percentage * 64)]
-        line = int((angle_percentage * 64 * 6) % 6 + 1)
-        color = int((angle_percentage * 64 * 6 * 6) % 6 + 1)
-        tone = int((angle_percentage * 64 * 6 * 6 * 6) % 6 + 1)
-        base = int((angle_percentage * 64 * 6 * 6 * 6 * 5) % 5 + 1)
-        
-        result_dict["label"].append(label)
-        result_dict["planets"].append(planet)
-        result_dict["lon"].append(long)
-        result_dict["gate"].append(gate)
-        result_dict["line"].append(line)
-        result_dict["color"].append(color)
-        result_dict["tone"].append(tone)
-        result_dict["base"].append(base)
-        result_dict["ch_gate"].append(0)  # Will be filled later
-    
+
     return result_dict
 
 def calculate_human_design(timestamp, timezone_info=None):
     """
     Calculate all Human Design features for a given birth time
-    
+
     Args:
         timestamp (tuple): Year, month, day, hour, minute, second, timezone_offset
         timezone_info (str, optional): Timezone name (e.g., 'Europe/Berlin')
             If provided, it will override the timezone_offset in timestamp
-    
+
     Returns:
         dict: Complete Human Design calculation results
     """
     # Validate timestamp format
     if len(timestamp) != 7:
         raise ValueError("Timestamp must be in format: (year, month, day, hour, minute, second, timezone_offset)")
-    
+
+    # The calculation depends only on the timestamp, so results are cached
+    # on the normalized tuple. Return a shallow copy so callers can add or
+    # replace keys without poisoning the cache.
+    return dict(_calculate_human_design_cached(tuple(timestamp)))
+
+@lru_cache(maxsize=2048)
+def _calculate_human_design_cached(timestamp):
+    """
+    Cached worker for calculate_human_design.
+
+    Args:
+        timestamp (tuple): Year, month, day, hour, minute, second, timezone_offset
+
+    Returns:
+        dict: Complete Human Design calculation results
+    """
     year, month, day, hour, minute, second, tz_offset = timestamp
     
     # Convert to Julian date
     birth_julday = timestamp_to_juldate(timestamp)
     
-    # Calculate design/create date (88° before birth)
+    # Calculate design/create date (88° before birth). Everything
+    # internal stays in Julian days; calendar conversion happens only
+    # at the output boundary below.
     create_julday = calc_create_date(birth_julday)
-    create_date = julian_to_datetime(create_julday)
-    
-    # Get planetary positions for birth (personality) and design
-    birth_planets = date_to_gate(birth_julday, "prs")
-    design_planets = date_to_gate(create_julday, "des")
-    
-    # Combine birth and design data
+
+    # Get planetary positions for birth (personality) and design,
+    # computed concurrently since the two passes are independent
+    birth_future = _PLANET_POOL.submit(date_to_gate, birth_julday, "prs")
+    design_future = _PLANET_POOL.submit(date_to_gate, create_julday, "des")
+    birth_planets = birth_future.result()
+    design_planets = design_future.result()
+    
+    # Combine birth and design data. This is the only place the combined
+    # structure is allocated; the personality/design outputs below are
+    # built from the pre-split dicts without re-scanning it.
     combined_data = {
-        key: birth_planets[key] + design_planets[key] 
-        for key in birth_planets.keys()
+        key: [*birth_planets[key], *design_planets[key]]
+        for key in birth_planets
     }
     
     # Calculate channels and defined centers
     channels_dict, active_centers = get_channels_and_centers(combined_data)
+    channel_meanings = get_channel_meanings(channels_dict)
     
     # Get individual Human Design features
     energy_type = get_energy_type(channels_dict, active_centers)
     authority = get_authority(active_centers, channels_dict)
     profile = get_profile(combined_data)
-    incarnation_cross = get_incarnation_cross(combined_data)
+    incarnation_cross, cross_type = get_incarnation_cross(combined_data)
     split = get_split(channels_dict, active_centers)
     variables = get_variables(combined_data)
     strategy = get_strategy(energy_type)
     
     # Calculate undefined centers
-    undefined_centers = list(set(CHAKRA_LIST) - set(active_centers))
+    undefined_centers = list(_CHAKRA_SET.difference(active_centers))
     
-    # Separate personality and design gates & lines
-    personality_gates = extract_personality_gates(combined_data)
-    design_gates = extract_design_gates(combined_data)
+    # Personality and design gates & lines, one pass per side with no
+    # label branching — the sides are never mixed before this point
+    personality_gates = _format_gates(birth_planets)
+    design_gates = _format_gates(design_planets)
     
-    # Format birth and design dates for output
+    # Format birth and design dates for output; this is the only place
+    # the design Julian day is converted back to calendar fields
     birth_date_str = f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
+    create_date = julian_to_datetime(create_julday)
     design_date_str = f"{create_date[0]}-{create_date[1]:02d}-{create_date[2]:02d} {create_date[3]:02d}:{create_date[4]:02d}:{create_date[5]:02d}"
     
     # Compile the complete results
@@ -200,13 +273,14 @@ def calculate_human_design(timestamp, timezone_info=None):
         "authority_name": AUTHORITY_DESCRIPTIONS.get(authority, authority),
         "profile": f"{profile[0]}/{profile[1]}",
         "incarnation_cross": incarnation_cross,
-        "cross_type": incarnation_cross.split("-")[-1] if "-" in incarnation_cross else "",
+        "cross_type": cross_type,
         "defined_centers": list(active_centers),
         "undefined_centers": undefined_centers,
         "split": split,
         "variables": variables,
-        "active_gates": [gate for gate in set(combined_data["gate"]) if gate != 0],
-        "active_channels": [f"{gate}/{ch_gate}" for gate, ch_gate in zip(channels_dict["gate"], channels_dict["ch_gate"])],
+        "active_gates": list(dict.fromkeys(gate for gate in combined_data["gate"] if gate != 0)),
+        "active_channels": [cm["channel"] for cm in channel_meanings],
+        "channel_meanings": channel_meanings,
         "personality_gates": personality_gates,
         "design_gates": design_gates,
         "all_gate_data": combined_data,
@@ -215,45 +289,22 @@ def calculate_human_design(timestamp, timezone_info=None):
     
     return results
 
-def extract_personality_gates(date_to_gate_dict):
+def _format_gates(planet_dict):
     """
-    Extract gates and lines from the personality (conscious) side
-    
-    Args:
-        date_to_gate_dict (dict): Combined gate data dictionary
-    
-    Returns:
-        list: Dictionary of gate numbers and lines
-    """
-    personality_gates = []
-    for i, label in enumerate(date_to_gate_dict["label"]):
-        if label == "prs":
-            personality_gates.append({
-                "gate": date_to_gate_dict["gate"][i],
-                "line": date_to_gate_dict["line"][i],
-                "planet": date_to_gate_dict["planets"][i]
-            })
-    return personality_gates
+    Format a date_to_gate result as a list of gate/line/planet dicts
 
-def extract_design_gates(date_to_gate_dict):
-    """
-    Extract gates and lines from the design (unconscious) side
-    
     Args:
-        date_to_gate_dict (dict): Combined gate data dictionary
-    
+        planet_dict (dict): Output of date_to_gate for one side (prs or des)
+
     Returns:
-        list: Dictionary of gate numbers and lines
-    """
-    design_gates = []
-    for i, label in enumerate(date_to_gate_dict["label"]):
-        if label == "des":
-            design_gates.append({
-                "gate": date_to_gate_dict["gate"][i],
-                "line": date_to_gate_dict["line"][i],
-                "planet": date_to_gate_dict["planets"][i]
-            })
-    return design_gates
+        list: Dicts with gate number, line and planet
+    """
+    return [
+        {"gate": gate, "line": line, "planet": planet}
+        for gate, line, planet in zip(
+            planet_dict["gate"], planet_dict["line"], planet_dict["planets"]
+        )
+    ]
 
 def get_channels_and_centers(date_to_gate_dict):
     """
@@ -270,51 +321,42 @@ def get_channels_and_centers(date_to_gate_dict):
     """
     # Get gate list
     gate_list = date_to_gate_dict["gate"]
-    ch_gate_list = date_to_gate_dict["ch_gate"].copy()
+    gate_set = set(gate_list)
+    # Filled in place; the caller owns the combined dict and its lists
+    ch_gate_list = date_to_gate_dict["ch_gate"]
     active_centers = []
-    
+
     # Map channel gates to gates, if channel exists
     for idx, gate in enumerate(gate_list):
-        ch_gate_a = FULL_DICT["full_gate_1_list"]
-        ch_gate_b = FULL_DICT["full_gate_2_list"]
-        
-        gate_indices = np.where(np.array(ch_gate_a) == gate)[0]
-        
-        for index in gate_indices:
-            potential_ch_gate = ch_gate_b[index]
-            if potential_ch_gate in gate_list:
-                ch_gate_list[idx] = potential_ch_gate
-                # Add the centers associated with this gate
-                active_centers.append(
-                    FULL_DICT["full_chakra_1_list"][FULL_DICT["full_gate_1_list"].index(gate)]
-                )
-                active_centers.append(
-                    FULL_DICT["full_chakra_2_list"][FULL_DICT["full_gate_2_list"].index(gate)]
-                )
+        for partner_gate, chakra, partner_chakra in GATE_PARTNERS.get(gate, ()):
+            if partner_gate in gate_set:
+                ch_gate_list[idx] = partner_gate
+                # Add the centers associated with this channel
+                active_centers.append(chakra)
+                active_centers.append(partner_chakra)
                 break
     
-    # Update ch_gate in the dictionary
-    date_to_gate_dict["ch_gate"] = ch_gate_list
-    
-    # Filter dictionary for active channels (ch_gate is not 0)
-    mask = np.array(date_to_gate_dict["ch_gate"]) != 0
-    
-    # Remove duplicates (e.g., (1,2) = (2,1))
-    sorted_channels = [sorted((date_to_gate_dict["gate"][i], date_to_gate_dict["ch_gate"][i])) 
-                      for i in range(len(date_to_gate_dict["gate"]))]
-    unique_indices = np.unique(sorted_channels, axis=0, return_index=True)[1]
-    dupl_mask = np.zeros(len(sorted_channels), dtype=bool)
-    dupl_mask[unique_indices] = True
-    
-    # Filter useful keys to result dict
-    active_channels_dict = {}
-    for key in ["label", "planets", "gate", "ch_gate"]:
-        active_channels_dict[key] = np.array(date_to_gate_dict[key])[dupl_mask & mask]
+    # Keep active channels (ch_gate is not 0), dropping reversed
+    # duplicates (e.g., (1,2) = (2,1)) in the same pass
+    seen = set()
+    keep = []
+    for i, (g, ch_g) in enumerate(zip(date_to_gate_dict["gate"], date_to_gate_dict["ch_gate"])):
+        if ch_g == 0:
+            continue
+        pair = (g, ch_g) if g <= ch_g else (ch_g, g)
+        if pair not in seen:
+            seen.add(pair)
+            keep.append(i)
+
+    active_channels_dict = {
+        key: [date_to_gate_dict[key][i] for i in keep]
+        for key in ("label", "planets", "gate", "ch_gate")
+    }
     
     # Map chakras to gates in new columns
-    active_channels_dict["gate_chakra"] = [FULL_DICT["full_gate_chakra_dict"][key] 
+    active_channels_dict["gate_chakra"] = [GATE_TO_CHAKRA[key]
                                          for key in active_channels_dict["gate"]]
-    active_channels_dict["ch_gate_chakra"] = [FULL_DICT["full_gate_chakra_dict"][key] 
+    active_channels_dict["ch_gate_chakra"] = [GATE_TO_CHAKRA[key]
                                             for key in active_channels_dict["ch_gate"]]
     
     # Map labels to gates and channel gates
@@ -323,67 +365,91 @@ def get_channels_and_centers(date_to_gate_dict):
     
     gate_label_list = []
     ch_gate_label_list = []
-    
-    # Convert gates and channel gates to tuple format (1,2)
+
+    # Index the planet positions by gate once, instead of rebuilding and
+    # scanning an array for every active channel
+    gate_to_indices = {}
+    for i, g in enumerate(date_to_gate_dict["gate"]):
+        gate_to_indices.setdefault(g, []).append(i)
+
+    labels = date_to_gate_dict["label"]
     for g, ch_g in zip(gate, ch_gate):
-        idx_gate = np.where(np.array(date_to_gate_dict['gate']) == g)[0]
-        idx_ch_gate = np.where(np.array(date_to_gate_dict['gate']) == ch_g)[0]
-        
-        gate_labels = [date_to_gate_dict["label"][int(i)] for i in idx_gate]
-        ch_gate_labels = [date_to_gate_dict["label"][int(i)] for i in idx_ch_gate]
-        
-        gate_label_list.append(gate_labels)
-        ch_gate_label_list.append(ch_gate_labels)
+        gate_label_list.append([labels[i] for i in gate_to_indices.get(g, ())])
+        ch_gate_label_list.append([labels[i] for i in gate_to_indices.get(ch_g, ())])
     
     active_channels_dict["ch_gate_label"] = ch_gate_label_list
     active_channels_dict["gate_label"] = gate_label_list
     
-    # Add channel meanings if available
-    channels = np.column_stack((active_channels_dict["gate"], active_channels_dict["ch_gate"]))
-    
-    # Create a full meaning dictionary (normal and reversed)
-    full_meaning_dict = {**CHANNEL_MEANING_DICT, 
-                        **{key[::-1]: value for key, value in CHANNEL_MEANING_DICT.items()}}
-    
-    # Get meanings for each channel
-    meanings = []
-    for channel in channels:
-        channel_tuple = tuple(channel)
-        meaning = full_meaning_dict.get(channel_tuple, ["Unknown", "Unknown"])
-        meanings.append(meaning)
-    
-    active_channels_dict["meaning"] = meanings
+    # Add channel meanings if available, via the order-independent table
+    active_channels_dict["meaning"] = [
+        CHANNEL_MEANING_BY_PAIR.get(
+            frozenset((gate, ch_gate)),
+            ["Unknown", "Unknown"]
+        )
+        for gate, ch_gate in zip(active_channels_dict["gate"], active_channels_dict["ch_gate"])
+    ]
     
     return active_channels_dict, set(active_centers)
 
+def get_connected_components(active_channels_dict):
+    """
+    Group the chakras joined by active channels into connected components.
+
+    Args:
+        active_channels_dict (dict): All active channels
+
+    Returns:
+        dict: Chakra -> component id for every chakra in an active channel
+    """
+    # Build the adjacency between channel ends
+    adjacency = {}
+    for chakra, ch_chakra in zip(active_channels_dict["gate_chakra"],
+                                 active_channels_dict["ch_gate_chakra"]):
+        adjacency.setdefault(chakra, set()).add(ch_chakra)
+        adjacency.setdefault(ch_chakra, set()).add(chakra)
+
+    # Label components via iterative depth-first search
+    components = {}
+    component_id = 0
+    for start in adjacency:
+        if start in components:
+            continue
+        components[start] = component_id
+        stack = [start]
+        while stack:
+            for neighbour in adjacency[stack.pop()]:
+                if neighbour not in components:
+                    components[neighbour] = component_id
+                    stack.append(neighbour)
+        component_id += 1
+
+    return components
+
 def is_connected(active_channels_dict, *args):
     """
     Check if chakras are connected through a channel.
     Direct and indirect connections are supported.
-    
+
     Args:
         active_channels_dict (dict): All active channels
         *args: Chakras to check for connection
-    
+
     Returns:
         bool: True if connected, False otherwise
     """
     # If gate list is empty (Reflector), return False
     if not len(active_channels_dict["gate"]):
         return False
-    
-    # Check if any gates connect the specified chakras
-    gate_chakra_mask = np.array([chakra in args for chakra in active_channels_dict["gate_chakra"]])
-    ch_gate_chakra_mask = np.array([chakra in args for chakra in active_channels_dict["ch_gate_chakra"]])
-    
-    # If gate and channel gate in the same line, they are connected
-    mask = gate_chakra_mask & ch_gate_chakra_mask
-    
-    # For 2 elements need 1 connection, for 3 elements need 2 connections, etc.
-    if sum(mask) >= len(args) - 1:
-        return True
-    
-    return False
+
+    # Connected means all queried chakras share one component
+    components = get_connected_components(active_channels_dict)
+    component_ids = set()
+    for chakra in args:
+        if chakra not in components:
+            return False
+        component_ids.add(components[chakra])
+
+    return len(component_ids) == 1
 
 def get_component(active_channels_dict, chakra):
     """
@@ -423,13 +489,10 @@ def get_energy_type(active_channels_dict, active_centers):
             return "PROJECTOR"
         
         # Check connections from motor centers (HT, SP, RT) to throat (=> Manifestor)
-        if "HT" in active_centers and is_connected(active_channels_dict, "HT", "TT"):
-            return "MANIFESTOR"
-        if "SP" in active_centers and is_connected(active_channels_dict, "SP", "TT"):
-            return "MANIFESTOR"
-        if "RT" in active_centers and is_connected(active_channels_dict, "RT", "TT"):
-            return "MANIFESTOR"
-        
+        for motor in active_centers & MOTORS:
+            if is_connected(active_channels_dict, motor, "TT"):
+                return "MANIFESTOR"
+
         # If no motor center is connected to the throat, it's a Projector
         return "PROJECTOR"
     
@@ -438,15 +501,10 @@ def get_energy_type(active_channels_dict, active_centers):
         return "GENERATOR"
     
     # Check connections from motor centers to throat (=> Manifesting Generator)
-    if "HT" in active_centers and is_connected(active_channels_dict, "HT", "TT"):
-        return "MANIFESTING GENERATOR"
-    if "SP" in active_centers and is_connected(active_channels_dict, "SP", "TT"):
-        return "MANIFESTING GENERATOR"
-    if "RT" in active_centers and is_connected(active_channels_dict, "RT", "TT"):
-        return "MANIFESTING GENERATOR"
-    if is_connected(active_channels_dict, "SL", "TT"):
-        return "MANIFESTING GENERATOR"
-    
+    for motor in active_centers & MOTORS_WITH_SACRAL:
+        if is_connected(active_channels_dict, motor, "TT"):
+            return "MANIFESTING GENERATOR"
+
     # No connection to throat => Generator
     return "GENERATOR"
 
@@ -497,29 +555,25 @@ def get_incarnation_cross(date_to_gate_dict):
         date_to_gate_dict (dict): Output of date_to_gate function
     
     Returns:
-        str: Incarnation Cross description
+        tuple: (Incarnation Cross description, cross type)
     """
     df = date_to_gate_dict
-    idx = int(len(df["planets"]) / 2)  # Start index of design values
-    
+    idx = N_PLANETS  # Start index of design values
+
     inc_cross = (
         (df["gate"][0], df["gate"][1]),  # Sun & Earth gate at birth
         (df["gate"][idx], df["gate"][idx+1])  # Sun & Earth gate at design
     )
-    
+
     profile = df["line"][0], df["line"][idx]
-    
-    # Get cross type (RAC, LAC, JXP)
-    if profile in IC_CROSS_TYP:
-        cr_typ = IC_CROSS_TYP[profile]
-    else:
-        # Try reversed profile
-        profile_rev = profile[::-1]
-        cr_typ = IC_CROSS_TYP.get(profile_rev, "Unknown")
-    
+
+    # Get cross type (RAC, LAC, JXP) via the closed-form rule; it
+    # matches the IC_CROSS_TYP lookup including the reversed fallback
+    cr_typ = cross_type(*profile)
+
     inc_cross_str = f"({inc_cross[0][0]},{inc_cross[0][1]})-({inc_cross[1][0]},{inc_cross[1][1]})-{cr_typ}"
-    
-    return inc_cross_str
+
+    return inc_cross_str, cr_typ
 
 def get_profile(date_to_gate_dict):
     """
@@ -532,7 +586,7 @@ def get_profile(date_to_gate_dict):
         tuple: Profile, e.g., (1, 4)
     """
     df = date_to_gate_dict
-    idx = int(len(df["line"]) / 2)  # Start idx of design values
+    idx = N_PLANETS  # Start idx of design values
     
     profile = (df["line"][0], df["line"][idx])  # Sun line at birth and design
     
@@ -553,7 +607,7 @@ def get_variables(date_to_gate_dict):
         dict: Variables for arrows
     """
     df = date_to_gate_dict
-    idx = int(len(df["tone"]) / 2)  # Start idx of design values
+    idx = N_PLANETS  # Start idx of design values
     
     tones = (
         df["tone"][0],     # Sun at birth
@@ -576,29 +630,15 @@ def get_split(active_channels_dict, active_centers):
         active_centers (set): Active/defined centers
     
     Returns:
-        int: Split value
+        int: Split value (number of separate definition areas,
+            0 for Reflectors)
     """
-    # Extract gate chakras
-    gate_chakra = active_channels_dict["gate_chakra"]
-    ch_gate_chakra = active_channels_dict["ch_gate_chakra"]
-    
-    # Create sorted chakra pairs to remove duplicates
-    sorted_chakras = [sorted((gate_chakra[i], ch_gate_chakra[i])) 
-                    for i in range(len(active_channels_dict["gate_chakra"]))]
-    
-    # Get unique chakra pairs
-    unique_indices = np.unique(sorted_chakras, axis=0, return_index=True)[1]
-    dupl_mask = np.zeros(len(sorted_chakras), dtype=bool)
-    dupl_mask[unique_indices] = True
-    
-    len_no_dupl_channel = sum(dupl_mask)
-    
-    # Calculate split
-    # If centers - channels = 0, there's no split (single connected component)
-    # If > 0, it indicates multiple disconnected components
-    split = len(active_centers) - len_no_dupl_channel
-    
-    return split
+    # The split is the number of connected components formed by the
+    # defined centers. The old centers-minus-channels arithmetic
+    # undercounted whenever the channels contained a cycle.
+    components = get_connected_components(active_channels_dict)
+
+    return len(set(components.values()))
 
 def get_strategy(energy_type):
     """
@@ -622,21 +662,14 @@ def get_channel_meanings(active_channels_dict):
     Returns:
         list: Channel descriptions
     """
-    channels = np.column_stack((active_channels_dict["gate"], active_channels_dict["ch_gate"]))
-    
-    # Create a full meaning dictionary (normal and reversed)
-    full_meaning_dict = {**CHANNEL_MEANING_DICT, 
-                        **{key[::-1]: value for key, value in CHANNEL_MEANING_DICT.items()}}
-    
     channel_meanings = []
-    for channel in channels:
-        channel_tuple = tuple(channel)
-        if channel_tuple in full_meaning_dict:
-            meaning = full_meaning_dict[channel_tuple]
+    for gate, ch_gate in zip(active_channels_dict["gate"], active_channels_dict["ch_gate"]):
+        meaning = CHANNEL_MEANING_BY_PAIR.get(frozenset((gate, ch_gate)))
+        if meaning is not None:
             channel_meanings.append({
-                "channel": f"{channel[0]}/{channel[1]}",
+                "channel": f"{gate}/{ch_gate}",
                 "name": meaning[0],
                 "description": meaning[1]
             })
-    
+
     return channel_meanings
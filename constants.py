@@ -13,6 +13,11 @@ This module contains all the constant values needed for Human Design calculation
 - Awareness streams
 """
 
+import sys
+from types import MappingProxyType
+
+import numpy as np
+
 # Synchronize I-Ching and zodiac circle: 58°
 # Human design systems start at gate 41 in Aries (source: Ra Uru Hu)
 ICHING_OFFSET = 58
@@ -43,11 +48,21 @@ ICHING_CIRCLE_LIST = [
     28, 44, 1, 43, 14, 34, 9, 5, 26, 11, 10, 58, 38, 54, 61, 60
 ]
 
+# Contiguous int8 view of the circle for vectorised longitude-to-gate
+# lookups, plus the reverse gate -> circle position map so callers
+# avoid the linear ICHING_CIRCLE_LIST.index() scan
+ICHING_CIRCLE_ARR = np.array(ICHING_CIRCLE_LIST, dtype=np.int8)
+GATE_TO_INDEX = {gate: i for i, gate in enumerate(ICHING_CIRCLE_LIST)}
+
 # Energy Centers (Chakras) abbreviations:
 # HD=Head, AA=Ajna, TT=Throat, GC=G-Centre, SL=Sacral, 
 # SN=Spleen, SP=Solar Plexus, HT=Heart/Ego, RT=Root
 CHAKRA_LIST = ["HD", "AA", "TT", "GC", "HT", "SP", "SN", "SL", "RT"]
 
+# Frozen membership sets: "is X a valid gate/chakra" as one hash probe
+ICHING_CIRCLE_SET = frozenset(ICHING_CIRCLE_LIST)
+CHAKRA_SET = frozenset(CHAKRA_LIST)
+
 # Gates to Chakra mapping - (gate1, gate2): (chakra1, chakra2)
 GATES_CHAKRA_DICT = {
     (64, 47): ("HD", "AA"),
@@ -144,6 +159,31 @@ IC_CROSS_TYP = {
     (6, 3): "LAC",
 }
 
+def cross_type(line1, line2):
+    """
+    Classify a profile into its incarnation cross type without a table scan.
+
+    Encodes the rule behind IC_CROSS_TYP: valid profiles have a design
+    line 2 or 3 steps past the personality line (mod 6); raw pairs in
+    the opposite order are flipped, matching the reversed-key fallback
+    of the dict lookup. (4, 1) is the single juxtaposition profile,
+    personality line 5 or 6 gives a left angle, the rest a right angle.
+
+    Args:
+        line1 (int): Personality Sun line (1-6)
+        line2 (int): Design Sun line (1-6)
+
+    Returns:
+        str: "RAC", "LAC", "JXP", or "Unknown" for non-harmonic pairs
+    """
+    if (line2 - line1) % 6 not in (2, 3):
+        line1, line2 = line2, line1
+        if (line2 - line1) % 6 not in (2, 3):
+            return "Unknown"
+    if (line1, line2) == (4, 1):
+        return "JXP"
+    return "LAC" if line1 >= 5 else "RAC"
+
 # Penta gates
 PENTA_DICT = {
     31: [], 8: [], 33: [], 7: [], 1: [], 13: [],
@@ -190,6 +230,38 @@ CIRCUIT_TYPE_DICT = {
     (10, 57): "Integration",
 }
 
+# Order-independent views of the channel tables above. The tuple keys
+# encode direction (value order follows key order), which consumers of
+# the chakra mapping rely on, so the originals stay as-is; these
+# frozenset-keyed companions serve callers holding an unordered gate
+# pair with a single probe instead of "try (a, b), then (b, a)".
+GATES_CHAKRA_BY_PAIR = {frozenset(k): v for k, v in GATES_CHAKRA_DICT.items()}
+CHANNEL_MEANING_BY_PAIR = {frozenset(k): v for k, v in CHANNEL_MEANING_DICT.items()}
+CIRCUIT_TYPE_BY_PAIR = {frozenset(k): v for k, v in CIRCUIT_TYPE_DICT.items()}
+
+# Consolidated per-channel record: chakras, meaning and circuit behind
+# one frozenset-keyed probe instead of three parallel dict lookups
+CHANNEL_INFO = {
+    pair: {
+        "chakras": chakras,
+        "meaning": CHANNEL_MEANING_BY_PAIR.get(pair),
+        "circuit": CIRCUIT_TYPE_BY_PAIR.get(pair),
+    }
+    for pair, chakras in GATES_CHAKRA_BY_PAIR.items()
+}
+
+# Flat per-gate channel index: gate -> [(partner_gate, (chakra_a, chakra_b)), ...],
+# so "which channels does gate G sit in" is a single lookup instead of a
+# scan over GATES_CHAKRA_DICT
+GATE_TO_CHANNELS = {}
+for _pair, _chakras in GATES_CHAKRA_DICT.items():
+    GATE_TO_CHANNELS.setdefault(_pair[0], []).append((_pair[1], _chakras))
+    GATE_TO_CHANNELS.setdefault(_pair[1], []).append((_pair[0], _chakras))
+del _pair, _chakras
+
+# Per-gate circuit index derived from CIRCUIT_TYPE_DICT
+GATE_TO_CIRCUIT = {g: circuit for pair, circuit in CIRCUIT_TYPE_DICT.items() for g in pair}
+
 # Circuit group types
 CIRCUIT_GROUP_TYPE_DICT = {
     "Knowledge": "Individual",
@@ -227,6 +299,17 @@ AWARENESS_STREAM_GROUP_DICT = {
     "Understand": "Ajna"
 }
 
+# Circuit group per channel, precomposing CIRCUIT_TYPE_DICT with
+# CIRCUIT_GROUP_TYPE_DICT so group classification is one lookup
+CIRCUIT_GROUP_BY_CHANNEL = {
+    frozenset(k): CIRCUIT_GROUP_TYPE_DICT[v] for k, v in CIRCUIT_TYPE_DICT.items()
+}
+
+# Flat per-gate stream indexes, so classifying an active gate is a
+# single lookup instead of scanning the 4-gate tuple keys
+GATE_TO_STREAM = {g: name for gates, name in AWARENESS_STREAM_DICT.items() for g in gates}
+GATE_TO_STREAM_GROUP = {g: AWARENESS_STREAM_GROUP_DICT[s] for g, s in GATE_TO_STREAM.items()}
+
 # Strategy by energy type
 STRATEGY_BY_TYPE = {
     "GENERATOR": "Wait to respond",
@@ -247,3 +330,48 @@ AUTHORITY_DESCRIPTIONS = {
     "outher_auth": "No Inner Authority",
     "lunar": "Lunar Authority"
 }
+
+# Freeze the lookup tables: sequences become tuples and dicts read-only
+# proxies, so no caller can mutate shared state by accident. Chakra and
+# planet names are interned on the way so every occurrence shares one
+# object and equality checks short-circuit on identity.
+ICHING_CIRCLE_LIST = tuple(ICHING_CIRCLE_LIST)
+CHAKRA_LIST = tuple(sys.intern(c) for c in CHAKRA_LIST)
+CHAKRA_SET = frozenset(CHAKRA_LIST)
+SWE_PLANET_DICT = MappingProxyType({sys.intern(k): v for k, v in SWE_PLANET_DICT.items()})
+GATES_CHAKRA_DICT = MappingProxyType({
+    k: (sys.intern(a), sys.intern(b)) for k, (a, b) in GATES_CHAKRA_DICT.items()
+})
+CHANNEL_MEANING_DICT = MappingProxyType(CHANNEL_MEANING_DICT)
+IC_CROSS_TYP = MappingProxyType(IC_CROSS_TYP)
+PENTA_DICT = MappingProxyType(PENTA_DICT)
+CIRCUIT_TYPE_DICT = MappingProxyType(CIRCUIT_TYPE_DICT)
+CIRCUIT_GROUP_TYPE_DICT = MappingProxyType(CIRCUIT_GROUP_TYPE_DICT)
+AWARENESS_STREAM_DICT = MappingProxyType(AWARENESS_STREAM_DICT)
+AWARENESS_STREAM_GROUP_DICT = MappingProxyType(AWARENESS_STREAM_GROUP_DICT)
+STRATEGY_BY_TYPE = MappingProxyType(STRATEGY_BY_TYPE)
+AUTHORITY_DESCRIPTIONS = MappingProxyType(AUTHORITY_DESCRIPTIONS)
+GATES_CHAKRA_BY_PAIR = MappingProxyType(GATES_CHAKRA_BY_PAIR)
+CHANNEL_MEANING_BY_PAIR = MappingProxyType(CHANNEL_MEANING_BY_PAIR)
+CIRCUIT_TYPE_BY_PAIR = MappingProxyType(CIRCUIT_TYPE_BY_PAIR)
+CHANNEL_INFO = MappingProxyType(CHANNEL_INFO)
+GATE_TO_CHANNELS = MappingProxyType(GATE_TO_CHANNELS)
+GATE_TO_CIRCUIT = MappingProxyType(GATE_TO_CIRCUIT)
+GATE_TO_INDEX = MappingProxyType(GATE_TO_INDEX)
+CIRCUIT_GROUP_BY_CHANNEL = MappingProxyType(CIRCUIT_GROUP_BY_CHANNEL)
+GATE_TO_STREAM = MappingProxyType(GATE_TO_STREAM)
+GATE_TO_STREAM_GROUP = MappingProxyType(GATE_TO_STREAM_GROUP)
+
+__all__ = [
+    "ICHING_OFFSET", "SWE_PLANET_DICT", "ICHING_CIRCLE_LIST",
+    "ICHING_CIRCLE_ARR", "GATE_TO_INDEX", "CHAKRA_LIST",
+    "ICHING_CIRCLE_SET", "CHAKRA_SET",
+    "GATES_CHAKRA_DICT", "CHANNEL_MEANING_DICT", "IC_CROSS_TYP", "cross_type",
+    "PENTA_DICT", "CIRCUIT_TYPE_DICT", "CIRCUIT_GROUP_TYPE_DICT",
+    "AWARENESS_STREAM_DICT", "AWARENESS_STREAM_GROUP_DICT",
+    "STRATEGY_BY_TYPE", "AUTHORITY_DESCRIPTIONS",
+    "GATES_CHAKRA_BY_PAIR", "CHANNEL_MEANING_BY_PAIR",
+    "CIRCUIT_TYPE_BY_PAIR", "CHANNEL_INFO",
+    "GATE_TO_CHANNELS", "GATE_TO_CIRCUIT",
+    "GATE_TO_STREAM", "GATE_TO_STREAM_GROUP", "CIRCUIT_GROUP_BY_CHANNEL",
+]
@@ -6,20 +6,33 @@ using Pydantic for data validation.
 """
 
 from typing import List, Dict, Optional, Tuple, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from datetime import datetime
 
 class BirthData(BaseModel):
     """Input data for Human Design calculation."""
+    # Frozen models are hashable and validation runs on pydantic v2's
+    # compiled core, keeping request parsing off the Python slow path
+    model_config = ConfigDict(frozen=True)
+
     year: int = Field(..., description="Birth year")
-    month: int = Field(..., description="Birth month (1-12)")
-    day: int = Field(..., description="Birth day (1-31)")
-    hour: int = Field(..., description="Birth hour (0-23)")
-    minute: int = Field(..., description="Birth minute (0-59)")
-    second: int = Field(0, description="Birth second (0-59)")
+    month: int = Field(..., ge=1, le=12, description="Birth month (1-12)")
+    day: int = Field(..., ge=1, le=31, description="Birth day (1-31)")
+    hour: int = Field(..., ge=0, le=23, description="Birth hour (0-23)")
+    minute: int = Field(..., ge=0, le=59, description="Birth minute (0-59)")
+    second: int = Field(0, ge=0, le=59, description="Birth second (0-59)")
     timezone: Optional[float] = Field(None, description="Timezone offset in hours (e.g., 2.0 for UTC+2)")
     timezone_name: Optional[str] = Field(None, description="Timezone name (e.g., 'Europe/Berlin')")
 
+    @model_validator(mode="after")
+    def check_calendar_date(self):
+        """Reject dates that pass the range checks but are not real days (e.g. Feb 30)."""
+        try:
+            datetime(self.year, self.month, self.day)
+        except ValueError as e:
+            raise ValueError(f"Invalid date: {e}")
+        return self
+
 class GateData(BaseModel):
     """Model for gate information."""
     gate: int = Field(..., description="Gate number")
@@ -2,9 +2,30 @@
 Run the Human Design API server.
 """
 
+import argparse
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("human_design.api:app", host="0.0.0.0", port=8000, reload=True)
+    parser = argparse.ArgumentParser(description="Run the Human Design API server.")
+    parser.add_argument(
+        "--dev", action="store_true",
+        help="Enable auto-reload for development (forces a single worker)"
+    )
+    args = parser.parse_args()
+
     print("Human Design API running at http://localhost:8000")
     print("API documentation available at http://localhost:8000/docs")
+
+    # uvloop + httptools move the event loop and HTTP parsing into C;
+    # one worker per CPU since the chart calculation is CPU-bound
+    uvicorn.run(
+        "human_design.api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if args.dev else os.cpu_count(),
+        reload=args.dev,
+    )
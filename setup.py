@@ -7,12 +7,18 @@ setup(
     install_requires=[
         "fastapi>=0.68.0",
         "uvicorn>=0.15.0",
-        "pydantic>=1.8.0",
+        "uvloop>=0.16.0; sys_platform != 'win32'",
+        "httptools>=0.4.0",
+        "orjson>=3.6.0",
+        "pydantic>=2.0",
         "pyswisseph>=2.10.0",
         "numpy>=1.20.0",
         "pytz>=2021.1",
         "python-dateutil>=2.8.2",
     ],
+    extras_require={
+        "test": ["pytest>=7.0", "pytest-xdist>=2.5"],
+    },
     author="Your Name",
     author_email="your.email@example.com",
     description="A Python package for Human Design calculations",
@@ -6,48 +6,61 @@ by verifying results for known birth dates.
 """
 
 import sys
-import json
+import orjson
 from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
 
-# Try to import the human_design package 
+# Try to import the human_design package
 try:
+    # calculate_human_design memoizes results per birth tuple at the
+    # definition site, so the repeated invocations below (run_tests,
+    # test_api, save_example_output share birth data) only compute once.
     from calculations import calculate_human_design
-    from utils import get_utc_offset_from_tz
+    from utils import get_cached_utc_offset
 except ImportError:
     print("Human Design package not found. Make sure it's installed or in the PYTHONPATH.")
     print("If you're running this script directly from the project directory,")
     print("try: PYTHONPATH=. python test.py")
     sys.exit(1)
 
-# Test cases with known results for validation
-TEST_CASES = [
-    {
-        "name": "Test Case 1: Manifesting Generator",
-        "birth_data": (1968, 2, 21, 11, 15, 0, 3),  # UTC+3
-        "timezone_name": "Europe/Istanbul",
-        "expected": {
-            "energy_type": "MANIFESTING GENERATOR",
-            "authority": "SP"  # Emotional Authority
-        }
-    },
-    {
-        "name": "Test Case 2: Generator",
-        "birth_data": (1973, 1, 19, 11, 15, 0, 3),  # UTC+3
-        "timezone_name": "Europe/Istanbul",
-        "expected": {
-            "energy_type": "GENERATOR",
-            "authority": "SL"  # Sacral Authority
-        }
-    },
-    {
-        "name": "Test Case 3: Dalai Lama - Projector",
-        "birth_data": (1935, 7, 6, 4, 48, 0, 8),  # UTC+8
-        "timezone_name": "Asia/Shanghai",
-        "expected": {
-            "energy_type": "PROJECTOR"
-        }
-    },
-]
+class BirthCase(NamedTuple):
+    """One frozen test case: birth data plus expected chart features."""
+    name: str
+    birth_data: Tuple[int, ...]
+    timezone_name: Optional[str]
+    expected: Tuple[Tuple[str, str], ...]
+
+# Test cases with known results for validation; built once at import
+# as immutable namedtuples so runners (and pytest parametrisation) can
+# share them without per-invocation dict rebuilds
+TEST_CASES: Tuple[BirthCase, ...] = (
+    BirthCase(
+        name="Test Case 1: Manifesting Generator",
+        birth_data=(1968, 2, 21, 11, 15, 0, 3),  # UTC+3
+        timezone_name="Europe/Istanbul",
+        expected=(
+            ("energy_type", "MANIFESTING GENERATOR"),
+            ("authority", "SP"),  # Emotional Authority
+        ),
+    ),
+    BirthCase(
+        name="Test Case 2: Generator",
+        birth_data=(1973, 1, 19, 11, 15, 0, 3),  # UTC+3
+        timezone_name="Europe/Istanbul",
+        expected=(
+            ("energy_type", "GENERATOR"),
+            ("authority", "SL"),  # Sacral Authority
+        ),
+    ),
+    BirthCase(
+        name="Test Case 3: Dalai Lama - Projector",
+        birth_data=(1935, 7, 6, 4, 48, 0, 8),  # UTC+8
+        timezone_name="Asia/Shanghai",
+        expected=(
+            ("energy_type", "PROJECTOR"),
+        ),
+    ),
+)
 
 def run_tests():
     """Run all test cases and verify results."""
@@ -55,19 +68,21 @@ def run_tests():
     passed_tests = 0
     
     for test_case in TEST_CASES:
-        print(f"\n{test_case['name']}")
-        print("-" * len(test_case['name']))
-        
+        print(f"\n{test_case.name}")
+        print("-" * len(test_case.name))
+
         # Get the birth data
-        birth_data = test_case["birth_data"]
-        timezone_name = test_case.get("timezone_name")
+        birth_data = test_case.birth_data
+        timezone_name = test_case.timezone_name
         
         # If timezone_name is provided, recalculate the offset
         if timezone_name:
             try:
                 # Get year, month, day, hour, minute, second from birth_data
                 timestamp = birth_data[:6]
-                offset = get_utc_offset_from_tz(timestamp, timezone_name)
+                # The offset only depends on the zone, date and hour, so
+                # the cached helper covers repeated cases for free
+                offset = get_cached_utc_offset(timezone_name, *timestamp[:4])
                 birth_data = (*timestamp, offset)
                 print(f"Using timezone: {timezone_name} (UTC{'+' if offset >= 0 else ''}{offset})")
             except Exception as e:
@@ -88,9 +103,7 @@ def run_tests():
             print(f"Channels: {', '.join(result['active_channels'])}")
             
             # Verify expected results
-            expected = test_case.get("expected", {})
-            
-            for key, expected_value in expected.items():
+            for key, expected_value in test_case.expected:
                 total_tests += 1
                 actual_value = result.get(key)
                 
@@ -109,29 +122,48 @@ def run_tests():
     
     return passed_tests == total_tests
 
+try:
+    import pytest
+except ImportError:  # pytest is optional; the __main__ runner works without it
+    pytest = None
+
+if pytest is not None:
+    @pytest.mark.parametrize("case", TEST_CASES, ids=lambda case: case.name)
+    def test_human_design_case(case):
+        """Pytest entry point over TEST_CASES; parallelises with pytest -n auto."""
+        birth_data = case.birth_data
+        if case.timezone_name:
+            offset = get_cached_utc_offset(case.timezone_name, *birth_data[:4])
+            birth_data = (*birth_data[:6], offset)
+        result = calculate_human_design(birth_data, case.timezone_name)
+        for key, expected_value in case.expected:
+            assert result.get(key) == expected_value, key
+
 def test_api():
     """Test the API functionality if available."""
     try:
         from fastapi.testclient import TestClient
+        from pydantic import TypeAdapter
         from human_design.api import app
-        
+        from human_design.models import BirthData
+
         client = TestClient(app)
-        
+
         print("\nTesting API")
         print("-" * 20)
-        
-        # Test the main calculation endpoint
-        test_data = {
-            "year": 1968,
-            "month": 2,
-            "day": 21,
-            "hour": 11,
-            "minute": 15,
-            "second": 0,
-            "timezone": 3,
-            "timezone_name": "Europe/Istanbul"
-        }
-        
+
+        # Validate all case payloads in one TypeAdapter pass, so the
+        # schema is walked once instead of per case
+        _FIELDS = ("year", "month", "day", "hour", "minute", "second", "timezone")
+        payloads = TypeAdapter(List[BirthData]).validate_python([
+            {**dict(zip(_FIELDS, case.birth_data)),
+             "timezone_name": case.timezone_name}
+            for case in TEST_CASES
+        ])
+
+        # Test the main calculation endpoint with the first case
+        test_data = payloads[0].model_dump()
+
         response = client.post("/calculate", json=test_data)
         
         if response.status_code == 200:
@@ -168,9 +200,9 @@ def save_example_output():
     birth_data = (1968, 2, 21, 11, 15, 0, 3)  # Feb 21, 1968, 11:15 AM, UTC+3
     result = calculate_human_design(birth_data)
     
-    # Save to a JSON file
-    with open("example_output.json", "w") as f:
-        json.dump(result, f, indent=2)
+    # Save to a JSON file; orjson serialises in native code
+    with open("example_output.json", "wb") as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     
     print("\nSaved example output to example_output.json")
 
@@ -7,9 +7,11 @@ This script demonstrates how to use the Human Design calculator
 to analyze birth data and output the results.
 """
 
+# Repeat calls with the same birth data are served from the LRU cache
+# inside calculations, so no per-script memoization wrapper is needed.
 from calculations import calculate_human_design
-from utils import get_utc_offset_from_tz
-import json
+from utils import get_cached_utc_offset
+import orjson
 from datetime import datetime
 
 def main():
@@ -53,7 +55,7 @@ def main():
     
     # Get the UTC offset from the timezone name
     timestamp = (year, month, day, hour, minute, second)
-    offset = get_utc_offset_from_tz(timestamp, timezone_name)
+    offset = get_cached_utc_offset(timezone_name, year, month, day, hour)
     
     print(f"Calculated UTC offset for {timezone_name}: {offset}")
     
@@ -90,9 +92,9 @@ def main():
     for gate_data in result['design_gates']:
         print(f"  Gate {gate_data['gate']}, Line {gate_data['line']} ({gate_data['planet']})")
     
-    # Save the full result to a JSON file
-    with open("full_result.json", "w") as f:
-        json.dump(result, f, indent=2)
+    # Save the full result to a JSON file; orjson serialises in native code
+    with open("full_result.json", "wb") as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     
     print("\nFull result saved to full_result.json")
 
@@ -6,27 +6,106 @@ timezone conversion, and other utility operations used in
 Human Design calculations.
 """
 
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
+
 from dateutil.relativedelta import relativedelta
+import numpy as np
 from pytz import timezone
+from pytz.exceptions import AmbiguousTimeError, NonExistentTimeError
 import swisseph as swe
 
+# Resolve the ephemeris path once and fault the ephemeris data into
+# memory with a throwaway J2000 Sun position, so the first real chart
+# does not pay the lazy file open (matters for cold web workers)
+swe.set_ephe_path(os.environ.get("SWE_EPHE_PATH"))
+swe.calc_ut(2451545.0, swe.SUN)
+
+# pytz parses the zone's tzdata on every timezone() call; cache the
+# resulting tzinfo objects so repeated lookups of the same zone are free
+_get_tz = lru_cache(maxsize=128)(timezone)
+
+# Prefer the stdlib zoneinfo (C-backed transition lookups) for offset
+# queries; pytz remains the fallback on older interpreters
+try:
+    from zoneinfo import ZoneInfo
+    _get_zoneinfo = lru_cache(maxsize=128)(ZoneInfo)
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+# Mean motion of the Sun in ecliptic longitude, degrees per day
+_SUN_MEAN_RATE = 0.9856474
+
+# Mean length in seconds of each supported step unit
+_UNIT_SECONDS = {
+    "years": 60 * 60 * 24 * 365.2425,
+    "months": 60 * 60 * 24 * 365.25 / 12,
+    "days": 60 * 60 * 24,
+    "hours": 60 * 60,
+    "minutes": 60,
+}
+
+@lru_cache(maxsize=8192)
+def _offset_for_hour(zone, year, month, day, hour):
+    """
+    Memoized UTC-offset core, keyed on (zone, date, hour).
+
+    DST transitions land on hour (or half-hour) boundaries, so the
+    offset never changes within an hour; day granularity would be
+    wrong on transition days. All offset lookups funnel through here.
+
+    Args:
+        zone (str): e.g. "Europe/Berlin"
+        year, month, day, hour (int): Date and hour
+
+    Returns:
+        float: Offset hours (decimal hours e.g. 0.75 for 45 min)
+    """
+    dt = datetime(year, month, day, hour)
+    if ZoneInfo is not None:
+        tz_offset = dt.replace(tzinfo=_get_zoneinfo(zone)).utcoffset().total_seconds()
+        return tz_offset / 3600
+
+    country = _get_tz(zone)
+    try:
+        # Asking the tzinfo for the offset directly skips building a
+        # localized datetime just to read it back off
+        tz_offset = country.utcoffset(dt).total_seconds()
+    except (AmbiguousTimeError, NonExistentTimeError):
+        # DST transition hours keep localize's standard-time resolution
+        tz_offset = country.localize(dt).utcoffset().total_seconds()
+    return tz_offset / 3600
+
 def get_utc_offset_from_tz(timestamp, zone):
     """
     Get UTC offset from given time zone.
     DST (daylight saving time) is respected (data from pytz lib)
-    
+
     Args:
         timestamp (tuple): Year, month, day, hour, minute, second
         zone (str): e.g. "Europe/Berlin"
-    
+
+    Returns:
+        float: Offset hours (decimal hours e.g. 0.75 for 45 min)
+    """
+    return _offset_for_hour(zone, *timestamp[:4])
+
+def get_cached_utc_offset(zone, year, month, day, hour):
+    """
+    Cached variant of get_utc_offset_from_tz.
+
+    The UTC offset never depends on minute or second, so caching on
+    (zone, date, hour) lets repeated requests skip the pytz lookup.
+
+    Args:
+        zone (str): e.g. "Europe/Berlin"
+        year, month, day, hour (int): Birth date and hour
+
     Returns:
         float: Offset hours (decimal hours e.g. 0.75 for 45 min)
     """
-    country = timezone(zone)
-    tz_offset = country.localize(datetime(*timestamp)).utcoffset().total_seconds()
-    hours = tz_offset / 3600
-    return hours
+    return _offset_for_hour(zone, year, month, day, hour)
 
 def timestamp_to_juldate(timestamp):
     """
@@ -43,26 +122,201 @@ def timestamp_to_juldate(timestamp):
     jdut = swe.utc_to_jd(*time_zone)
     return jdut[1]
 
+def batch_julday(year, month, day, hour, minute, second, tz_offset):
+    """
+    Convert arrays of civil timestamps to Julian dates in one pass.
+
+    Implements the Fliegel-Van Flandern Gregorian-to-JD formula with
+    NumPy integer arithmetic, so a whole sweep of timestamps (e.g. the
+    output of generate_timestamp_range) converts without one swisseph
+    call per element. Accurate to UTC; use timestamp_to_juldate when a
+    single conversion needs swisseph's delta-T handling.
+
+    Args:
+        year, month, day, hour, minute, second (np.ndarray): int64 arrays
+        tz_offset (np.ndarray): Offset hours (float, e.g. 0.75 for 45 min)
+
+    Returns:
+        np.ndarray: Julian dates (float64)
+    """
+    a = (14 - month) // 12
+    jdn = ((1461 * (year + 4800 - a)) // 4
+           + (367 * (month - 2 + 12 * a)) // 12
+           - (3 * ((year + 4900 - a) // 100)) // 4
+           + day - 32075)
+    return (jdn + (hour - 12.0) / 24.0 + minute / 1440.0
+            + second / 86400.0 - tz_offset / 24.0)
+
+def julday_fast(year, month, day, hour, minute, second):
+    """
+    Closed-form Gregorian-to-Julian-day conversion (UT, no delta-T).
+
+    Scalar sibling of batch_julday for single conversions that do not
+    need swisseph's sub-second UT1 handling.
+
+    Args:
+        year, month, day, hour, minute, second (int): Civil timestamp (UTC)
+
+    Returns:
+        float: Julian date
+    """
+    a = (14 - month) // 12
+    jdn = ((1461 * (year + 4800 - a)) // 4
+           + (367 * (month - 2 + 12 * a)) // 12
+           - (3 * ((year + 4900 - a) // 100)) // 4
+           + day - 32075)
+    return jdn + (hour - 12.0) / 24.0 + minute / 1440.0 + second / 86400.0
+
+def timestamp_to_juldate_fast(timestamp):
+    """
+    Pure-math variant of timestamp_to_juldate for bulk sweeps.
+
+    Skips both swisseph boundary crossings (utc_time_zone, utc_to_jd);
+    differs from the swisseph path only by the sub-second UT1-UTC
+    correction.
+
+    Args:
+        timestamp (tuple): Format: year, month, day, hour, minute, second, time_zone_offset
+
+    Returns:
+        float: Julian date
+    """
+    year, month, day, hour, minute, second, tz_offset = timestamp
+    return julday_fast(year, month, day, hour, minute, second) - tz_offset / 24.0
+
+def _sun_longitude_fast(jd):
+    """
+    Approximate ecliptic longitude of the Sun in degrees.
+
+    Truncated series (mean longitude plus equation of center), good to
+    ~0.01 degree within a few centuries of J2000 - plenty for seeding
+    the design-date search, which swisseph then refines.
+
+    Args:
+        jd (float): Timestamp in Julian day format
+
+    Returns:
+        float: Ecliptic longitude in degrees (0-360)
+    """
+    t = (jd - 2451545.0) / 36525.0
+    l0 = 280.46646 + 36000.76983 * t + 0.0003032 * t * t
+    m = np.deg2rad(357.52911 + 35999.05029 * t - 0.0001537 * t * t)
+    c = ((1.914602 - 0.004817 * t - 0.000014 * t * t) * np.sin(m)
+         + (0.019993 - 0.000101 * t) * np.sin(2.0 * m)
+         + 0.000289 * np.sin(3.0 * m))
+    return (l0 + c) % 360.0
+
+# JIT-compile the pure-math kernels when numba is installed; the NumPy
+# expressions above are the fallback, exactly as in calculations
+try:
+    from numba import njit
+    batch_julday = njit(cache=True, fastmath=True)(batch_julday)
+    julday_fast = njit(cache=True, fastmath=True)(julday_fast)
+    julday_fast(2000, 1, 1, 12, 0, 0)  # warm up at import
+    _sun_longitude_fast = njit(cache=True, fastmath=True)(_sun_longitude_fast)
+    _sun_longitude_fast(2451545.0)  # warm up at import
+    batch_julday(np.zeros(1, np.int64), np.ones(1, np.int64), np.ones(1, np.int64),
+                 np.zeros(1, np.int64), np.zeros(1, np.int64), np.zeros(1, np.int64),
+                 np.zeros(1))  # warm up at import
+except ImportError:
+    pass
+
 def calc_create_date(jdut):
     """
     Calculate design/creation date from birth date.
     Sun position -88° longitude, approximately 3 months before birth
     (Source: Ra Uru Hu)
-    
+
     Args:
         jdut (float): Julian day format timestamp
-    
+
     Returns:
         float: Creation date in Julian day format
     """
+    # Quantize to whole seconds so repeated birth times hit the cache
+    # even when float noise differs between conversion paths
+    return _calc_create_date_cached(round(jdut * 86400))
+
+@lru_cache(maxsize=1024)
+def _calc_create_date_cached(jdut_ticks):
+    """
+    Cached worker for calc_create_date.
+
+    Args:
+        jdut_ticks (int): Julian day timestamp quantized to seconds
+
+    Returns:
+        float: Creation date in Julian day format
+    """
+    jdut = jdut_ticks / 86400
     design_pos = 88
     sun_long = swe.calc_ut(jdut, swe.SUN)[0][0]
-    long = swe.degnorm(sun_long - design_pos)
-    tstart = jdut - 100  # approximation is start -100°
-    res = swe.solcross_ut(long, tstart)
-    create_date = swe.revjul(res)
-    create_julday = swe.julday(*create_date)
-    return create_julday
+    target = swe.degnorm(sun_long - design_pos)
+
+    # Seed ~89 days before birth from the Sun's mean rate, then pre-
+    # refine against the cheap series longitude. Measuring the series
+    # at both ends cancels most of its bias, so the seed lands within
+    # ~0.01 degrees without touching swisseph.
+    res = jdut - design_pos / _SUN_MEAN_RATE
+    fast_target = _sun_longitude_fast(jdut) - design_pos
+    for _ in range(2):
+        err = (_sun_longitude_fast(res) - fast_target) % 360.0
+        if err > 180.0:
+            err -= 360.0
+        res -= err / _SUN_MEAN_RATE
+
+    # Newton-refine on the true longitude and speed; from the series
+    # seed this needs ~2 calc_ut evaluations and agrees with
+    # swe.solcross_ut to sub-millisecond.
+    for _ in range(6):
+        lon, _, _, speed = swe.calc_ut(res, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][:4]
+        err = swe.degnorm(lon - target)
+        if err > 180.0:
+            err -= 360.0
+        if abs(err) < 1e-9:
+            break
+        res -= err / speed
+
+    # res already is a Julian day; no revjul/julday round-trip needed
+    return res
+
+def calc_create_date_batch(jduts):
+    """
+    Calculate design/creation dates for a batch of birth Julian dates.
+
+    Same mean-rate seed and Newton refinement as calc_create_date, with
+    the seeding and convergence bookkeeping vectorized; Python loops
+    remain only around the scalar swe.calc_ut evaluations, and entries
+    drop out of the refinement as they converge.
+
+    Args:
+        jduts (array-like): Birth timestamps in Julian day format
+
+    Returns:
+        np.ndarray: Creation dates in Julian day format (float64)
+    """
+    jduts = np.asarray(jduts, dtype=np.float64)
+    targets = np.empty_like(jduts)
+    for i, jd in enumerate(jduts.tolist()):
+        targets[i] = swe.calc_ut(jd, swe.SUN)[0][0]
+    targets = (targets - 88.0) % 360.0
+
+    est = jduts - 88.0 / _SUN_MEAN_RATE
+    active = np.ones(jduts.shape, dtype=bool)
+    for _ in range(6):
+        remaining = np.nonzero(active)[0]
+        if remaining.size == 0:
+            break
+        for i in remaining.tolist():
+            lon, _, _, speed = swe.calc_ut(est[i], swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][:4]
+            err = (lon - targets[i]) % 360.0
+            if err > 180.0:
+                err -= 360.0
+            if abs(err) < 1e-9:
+                active[i] = False
+            else:
+                est[i] -= err / speed
+    return est
 
 def julian_to_datetime(julian_date):
     """
@@ -74,7 +328,8 @@ def julian_to_datetime(julian_date):
     Returns:
         tuple: Year, month, day, hour, minute, second
     """
-    return swe.jdut1_to_utc(julian_date)[:-1]
+    year, month, day, hour, minute, second = swe.jdut1_to_utc(julian_date)
+    return (year, month, day, hour, minute, int(second))
 
 def generate_timestamp_range(start_date, end_date, percentage=1.0, time_unit="days", interval=1):
     """
@@ -93,40 +348,83 @@ def generate_timestamp_range(start_date, end_date, percentage=1.0, time_unit="da
     start_date = datetime(*start_date)
     end_date = datetime(*end_date)
     
-    # Calculate the time unit in seconds
-    if time_unit == "years":
-        unit = 60 * 60 * 24 * 365.2425
-    elif time_unit == "months":
-        unit = 60 * 60 * 24 * 365.25 / 12
-    elif time_unit == "days":
-        unit = 60 * 60 * 24
-    elif time_unit == "hours":
-        unit = 60 * 60
-    elif time_unit == "minutes":
-        unit = 60
-    else:
+    # Look up the time unit in seconds
+    try:
+        unit = _UNIT_SECONDS[time_unit]
+    except KeyError:
         raise ValueError(f"Invalid time unit: {time_unit}")
     
-    # Calculate the number of steps
+    # Calculate the number of steps; fail bad ranges before any work
     time_diff_range = int((end_date - start_date).total_seconds() / unit)
     total_steps = int(time_diff_range * percentage / interval)
-    
-    timestamp_list = []
-    for i in range(total_steps):
-        # Calculate the new date for this step
-        if time_unit in ["years", "months"]:
-            # relativedelta handles years and months properly
-            new_date = end_date - i * relativedelta(**{time_unit: interval})
-        else:
-            # timedelta is faster for days, hours, minutes
-            new_date = end_date - i * timedelta(seconds=unit * interval)
-            
-        timestamp = (new_date.year, new_date.month, new_date.day, 
-                    new_date.hour, new_date.minute, 0, 0)
-        timestamp_list.append(timestamp)
-    
-    # Sanity check
-    if not timestamp_list:
+    if total_steps <= 0:
         raise ValueError('Check that startdate < enddate & (enddate-interval) >= startdate')
-    
+
+    if time_unit in ("days", "hours", "minutes"):
+        # Fixed-length steps vectorize: one datetime64 subtraction and a
+        # handful of C-level casts replace total_steps datetime objects
+        step = np.timedelta64(int(unit * interval), "s")
+        dates = np.datetime64(end_date, "s") - np.arange(total_steps) * step
+        years = dates.astype("datetime64[Y]")
+        months = dates.astype("datetime64[M]")
+        days = dates.astype("datetime64[D]")
+        hours = dates.astype("datetime64[h]")
+        timestamp_list = [
+            (y + 1970, mo + 1, d + 1, h, mi, 0, 0)
+            for y, mo, d, h, mi in zip(
+                years.astype(np.int64).tolist(),
+                (months - years).astype(np.int64).tolist(),
+                (days - months).astype(np.int64).tolist(),
+                (hours - days).astype(np.int64).tolist(),
+                (dates.astype("datetime64[m]") - hours).astype(np.int64).tolist(),
+            )
+        ]
+    else:
+        # relativedelta handles calendar-accurate years and months. The
+        # step is built once; i * step must stay (a running subtraction
+        # would drift on month-end clamping, e.g. Mar 31 -> Feb 28 -> Jan 28)
+        step = relativedelta(**{time_unit: interval})
+        # Preallocate; index assignment avoids append's resize churn
+        timestamp_list = [None] * total_steps
+        for i in range(total_steps):
+            new_date = end_date - i * step
+            # One timetuple call and a slice instead of five attribute reads
+            timestamp_list[i] = new_date.timetuple()[:5] + (0, 0)
+
     return timestamp_list
+
+def generate_juldate_range(start_date, end_date, percentage=1.0, time_unit="days", interval=1):
+    """
+    Generate Julian dates within a given range, newest first.
+
+    Skips the timestamp-tuple detour: the end date is converted to a
+    Julian day once and the steps are a single vectorized subtraction,
+    so sweep callers avoid one datetime construction and one swisseph
+    utc_to_jd call per step. Years and months step by their mean length
+    here; use generate_timestamp_range when calendar-accurate
+    year/month boundaries matter.
+
+    Args:
+        start_date (tuple): (year, month, day, hour, minute, second, timezone_offset)
+        end_date (tuple): (year, month, day, hour, minute, second, timezone_offset)
+        percentage (float): Percentage of the time range to process (0.0-1.0)
+        time_unit (str): "years", "months", "days", "hours", or "minutes"
+        interval (int): Step size in the specified time unit
+
+    Returns:
+        np.ndarray: Julian dates (float64), descending from end_date
+    """
+    try:
+        unit = _UNIT_SECONDS[time_unit]
+    except KeyError:
+        raise ValueError(f"Invalid time unit: {time_unit}")
+
+    time_diff = datetime(*end_date[:6]) - datetime(*start_date[:6])
+    time_diff_range = int(time_diff.total_seconds() / unit)
+    total_steps = int(time_diff_range * percentage / interval)
+    if total_steps <= 0:
+        raise ValueError('Check that startdate < enddate & (enddate-interval) >= startdate')
+
+    jd_end = timestamp_to_juldate(end_date)
+    step_days = unit * interval / 86400.0
+    return jd_end - np.arange(total_steps) * step_days